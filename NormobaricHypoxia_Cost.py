@@ -18,8 +18,24 @@ Assumptions:
 - Physiological responses are based on average adult data and standard physiological models.
 """
 
+import argparse
+import functools
+import json
+import math
 import sys
 
+import numpy as np
+
+# Physiological constants
+SEA_LEVEL_PRESSURE = 760.0  # mmHg
+AVG_VENTILATION_RATE_SL = 6.0  # L/min at sea level (resting)
+AVG_HEART_RATE_SL = 70.0  # bpm at sea level (resting)
+FiO2 = 0.2095  # Fraction of inspired oxygen in dry air
+PH2O = 47.0  # Water vapor pressure at body temperature (mmHg)
+VENTILATION_ONSET_M = 1500.0  # Altitude (m) above which ventilation increases
+MAX_VENTILATION_RATE = 60.0  # L/min cap to avoid unrealistic values
+HEART_RATE_ONSET_M = 1000.0  # Altitude (m) above which heart rate increases
+
 def get_user_input(prompt: str, default_value=None, value_type=float):
     """
     Prompt the user to enter a value, allowing for a default if no input is given.
@@ -41,99 +57,197 @@ def get_user_input(prompt: str, default_value=None, value_type=float):
         except ValueError:
             print(f"Invalid input. Please enter a valid {value_type.__name__}.")
 
-def calculate_physiological_parameters(altitude_ft: float) -> dict:
+def _pressure_mmHg(altitude_m):
     """
-    Calculate physiological parameters for an average adult at a given altitude.
+    Barometric formula: atmospheric pressure in mmHg at an altitude in meters (float or array).
+    """
+    return SEA_LEVEL_PRESSURE * (1 - (2.25577e-5 * altitude_m)) ** 5.25588
+
+def _pao2_mmHg(pressure_mmHg):
+    """
+    Approximate arterial oxygen partial pressure in mmHg from the atmospheric pressure (float or array).
+    """
+    PiO2 = (pressure_mmHg - PH2O) * FiO2  # Inspired oxygen, after subtracting water vapor pressure
+    return PiO2 - 5  # Approximate alveolar-arterial gradient
+
+def _sao2_percent(pao2_mmHg):
+    """
+    Arterial oxygen saturation in percent from PaO2 via the Hill equation (float or array).
+    """
+    pao2_cubed = pao2_mmHg * pao2_mmHg * pao2_mmHg
+    return 100 * pao2_cubed / (pao2_cubed + 150 ** 3)
+
+def _ventilation_rate(altitude_above_onset_m):
+    """
+    Uncapped ventilation rate in L/min, +100% per 1,000 m above VENTILATION_ONSET_M (float or array).
+    """
+    return AVG_VENTILATION_RATE_SL * (1 + altitude_above_onset_m / 1000)
+
+def _heart_rate(altitude_above_onset_m):
+    """
+    Heart rate in bpm, +1 bpm per 100 m above HEART_RATE_ONSET_M (float or array).
+    """
+    return AVG_HEART_RATE_SL + altitude_above_onset_m / 100
+
+def _physio_kernel(altitude_ft: float) -> tuple:
+    """
+    Evaluate the physiological models for a single altitude.
 
     Parameters:
     - altitude_ft: Altitude in feet.
 
     Returns:
-    - Dictionary containing physiological parameters.
+    - Tuple (altitude_m, pressure_mmHg, PaO2_mmHg, SaO2_percent, ventilation_rate_L_per_min, heart_rate_bpm).
     """
-    # Constants
-    SEA_LEVEL_PRESSURE = 760  # mmHg
-    AVG_VENTILATION_RATE_SL = 6  # L/min at sea level (resting)
-    AVG_HEART_RATE_SL = 70  # bpm at sea level (resting)
+    altitude_m = altitude_ft * 0.3048
+    pressure_at_altitude = _pressure_mmHg(altitude_m)
+    PaO2 = _pao2_mmHg(pressure_at_altitude)
+    ventilation_rate = min(_ventilation_rate(max(0.0, altitude_m - VENTILATION_ONSET_M)), MAX_VENTILATION_RATE)
+    heart_rate = _heart_rate(max(0.0, altitude_m - HEART_RATE_ONSET_M))
+    return altitude_m, pressure_at_altitude, PaO2, _sao2_percent(PaO2), ventilation_rate, heart_rate
 
-    # Calculate atmospheric pressure at altitude
-    altitude_m = altitude_ft * 0.3048  # Convert feet to meters
-    pressure_at_altitude = SEA_LEVEL_PRESSURE * (1 - (2.25577e-5 * altitude_m)) ** 5.25588  # Barometric formula
+def _physiology_from_altitude_m(altitude_m: np.ndarray) -> tuple:
+    """
+    Evaluate the physiological models element-wise for altitudes given in meters.
 
-    # Calculate inspired oxygen partial pressure (PiO2)
-    FiO2 = 0.2095  # Fraction of inspired oxygen in dry air
-    PiO2 = (pressure_at_altitude - 47) * FiO2  # Subtract water vapor pressure (47 mmHg)
+    Uses the same helpers as _physio_kernel, with the NumPy equivalents of its max/min clamps.
 
-    # Estimate arterial oxygen saturation (SaO2)
-    PaO2 = PiO2 - 5  # Approximate alveolar-arterial gradient
-    SaO2 = 100 * (PaO2 ** 3) / (PaO2 ** 3 + 150 ** 3)
+    Parameters:
+    - altitude_m: Array of altitudes in meters.
 
-    # Adjust ventilation rate based on hypoxic ventilatory response
-    altitude_above_1500_m = max(0, altitude_m - 1500)
-    ventilation_increase_factor = (altitude_above_1500_m / 1000)  # 100% increase per 1,000 m
-    ventilation_rate = AVG_VENTILATION_RATE_SL * (1 + ventilation_increase_factor)
-    ventilation_rate = min(ventilation_rate, 60)  # Cap ventilation rate to avoid unrealistic values
+    Returns:
+    - Tuple of arrays (pressure_mmHg, PaO2_mmHg, SaO2_percent, ventilation_rate_L_per_min, heart_rate_bpm).
+    """
+    pressure_at_altitude = _pressure_mmHg(altitude_m)
+    PaO2 = _pao2_mmHg(pressure_at_altitude)
+    ventilation_rate = np.minimum(
+        _ventilation_rate(np.maximum(0.0, altitude_m - VENTILATION_ONSET_M)), MAX_VENTILATION_RATE
+    )
+    heart_rate = _heart_rate(np.maximum(0.0, altitude_m - HEART_RATE_ONSET_M))
+    return pressure_at_altitude, PaO2, _sao2_percent(PaO2), ventilation_rate, heart_rate
 
-    # Adjust heart rate based on hypoxia
-    altitude_above_1000_m = max(0, altitude_m - 1000)
-    heart_rate_increase = altitude_above_1000_m / 100
-    heart_rate = AVG_HEART_RATE_SL + heart_rate_increase
+# Keys of the values computed by the physiology models, in output order after "altitude_ft"
+_PHYSIO_KEYS = (
+    "altitude_m", "pressure_at_altitude_mmHg", "PaO2_mmHg", "SaO2_percent",
+    "ventilation_rate_L_per_min", "heart_rate_bpm"
+)
 
-    return {
-        "altitude_ft": altitude_ft,
-        "altitude_m": altitude_m,
-        "pressure_at_altitude_mmHg": pressure_at_altitude,
-        "PaO2_mmHg": PaO2,
-        "SaO2_percent": SaO2,
-        "ventilation_rate_L_per_min": ventilation_rate,
-        "heart_rate_bpm": heart_rate
-    }
+def physiology_array(altitude_ft) -> dict:
+    """
+    Calculate physiological parameters for an array of altitudes.
 
-def calculate_gas_consumption(sessions_per_week: int, weeks: int, session_duration_minutes: float, ventilation_rate: float, recovery_duration_minutes: float, price_air: float, price_nitrogen: float, price_oxygen: float, contingency_percentage: float = 0.10) -> dict:
+    Every altitude is evaluated directly with NumPy ufuncs.
+
+    Parameters:
+    - altitude_ft: Array-like of altitudes in feet.
+
+    Returns:
+    - Dictionary of arrays with the same shape as altitude_ft.
     """
-    Calculate gas consumption and costs for the training program.
-    
+    altitude_ft_array = np.asarray(altitude_ft, dtype=np.float64)
+    altitude_m = altitude_ft_array * 0.3048  # Convert feet to meters
+    values = _physiology_from_altitude_m(altitude_m)
+    return {"altitude_ft": altitude_ft_array, **dict(zip(_PHYSIO_KEYS, (altitude_m, *values)))}
+
+@functools.lru_cache(maxsize=1024)
+def _calc_physio_cached(altitude_ft: float) -> tuple:
+    """
+    Memoized scalar physiology, so repeated requests for the same altitude skip the kernel.
+
+    Parameters:
+    - altitude_ft: Altitude in feet.
+
+    Returns:
+    - Tuple of floats in _PHYSIO_KEYS order.
+    """
+    return _physio_kernel(altitude_ft)
+
+def calculate_physiological_parameters(altitude_ft) -> dict:
+    """
+    Calculate physiological parameters for an average adult at a given altitude.
+
+    A single altitude is evaluated by the scalar kernel (memoized per altitude) and returns floats;
+    array inputs are delegated to physiology_array.
+
+    Parameters:
+    - altitude_ft: Altitude in feet (scalar or array-like).
+
+    Returns:
+    - Dictionary containing physiological parameters (floats for a scalar altitude, arrays otherwise).
+    """
+    if isinstance(altitude_ft, (int, float)):
+        altitude_m, pressure_at_altitude, PaO2, SaO2, ventilation_rate, heart_rate = _calc_physio_cached(altitude_ft)
+        return {
+            "altitude_ft": altitude_ft,
+            "altitude_m": altitude_m,
+            "pressure_at_altitude_mmHg": pressure_at_altitude,
+            "PaO2_mmHg": PaO2,
+            "SaO2_percent": SaO2,
+            "ventilation_rate_L_per_min": ventilation_rate,
+            "heart_rate_bpm": heart_rate
+        }
+    if np.ndim(altitude_ft) != 0:
+        return physiology_array(altitude_ft)
+    return calculate_physiological_parameters(float(altitude_ft))
+
+def _per_session_consumption(ventilation_rate: float, session_duration_minutes: float, recovery_duration_minutes: float) -> tuple:
+    """
+    Calculate the gas consumed by a single training session.
+
+    The result depends only on the physiology and session timing, so it can be computed once
+    and reused for any number of schedules and price combinations.
+
     Parameters:
-    - sessions_per_week: Number of sessions per week.
-    - weeks: Number of weeks.
-    - session_duration_minutes: Duration of each session in minutes.
     - ventilation_rate: Ventilation rate in L/min.
+    - session_duration_minutes: Duration of each session in minutes.
     - recovery_duration_minutes: Duration of recovery in minutes.
-    - price_air: Price of compressed air per m3.
-    - price_nitrogen: Price of nitrogen per m3.
-    - price_oxygen: Price of oxygen per m3.
+
+    Returns:
+    - Tuple (air, nitrogen, oxygen) with the consumption per session in m3.
+    """
+    session_vol = ventilation_rate * session_duration_minutes * 1e-3  # Convert L to m3
+    recovery_vol = ventilation_rate * recovery_duration_minutes * 1e-3  # Oxygen during recovery
+    return session_vol, session_vol * 0.05, recovery_vol  # Nitrogen is 5% on top of the air
+
+def _costs_from_consumption(per_session: tuple, sessions_per_week, weeks, prices: tuple, contingency_percentage=0.10) -> dict:
+    """
+    Scale per-session consumption to weekly and total consumption and costs.
+
+    Every argument may be a NumPy array; arrays are broadcast against each other, so a parameter
+    sweep is a single vectorized expression, e.g. passing sessions_per_week[:, None, None],
+    weeks[None, :, None] and prices whose entries have shape (1, 1, n).
+
+    Parameters:
+    - per_session: Tuple (air, nitrogen, oxygen) of consumption per session in m3.
+    - sessions_per_week: Number of sessions per week.
+    - weeks: Number of weeks.
+    - prices: Tuple (price_air, price_nitrogen, price_oxygen) per m3.
     - contingency_percentage: Additional cost contingency.
-    
+
     Returns:
     - Dictionary with consumption and cost details.
     """
-    # Calculate per-session consumption in m3
-    air_consumed_per_session = (ventilation_rate * session_duration_minutes) / 1000  # Convert to m3
-    nitrogen_consumed_per_session = air_consumed_per_session * 0.05  # Additional nitrogen
-    oxygen_consumed_per_session = (ventilation_rate * recovery_duration_minutes) / 1000  # During recovery
-
-    # Weekly consumption
-    weekly_air_consumption = air_consumed_per_session * sessions_per_week
-    weekly_nitrogen_consumption = nitrogen_consumed_per_session * sessions_per_week
-    weekly_oxygen_consumption = oxygen_consumed_per_session * sessions_per_week
+    air_consumed_per_session, nitrogen_consumed_per_session, oxygen_consumed_per_session = per_session
+    price_air, price_nitrogen, price_oxygen = prices
 
-    # Total consumption over training period
-    total_air_consumption = weekly_air_consumption * weeks
-    total_nitrogen_consumption = weekly_nitrogen_consumption * weeks
-    total_oxygen_consumption = weekly_oxygen_consumption * weeks
+    # Total consumption over the training period, scaling each volume by the session count once
+    total_sessions = sessions_per_week * weeks
+    total_air_consumption = air_consumed_per_session * total_sessions
+    total_nitrogen_consumption = nitrogen_consumed_per_session * total_sessions
+    total_oxygen_consumption = oxygen_consumed_per_session * total_sessions
 
     # Costs
     total_cost_air = total_air_consumption * price_air
     total_cost_nitrogen = total_nitrogen_consumption * price_nitrogen
     total_cost_oxygen = total_oxygen_consumption * price_oxygen
-
     total_cost = total_cost_air + total_cost_nitrogen + total_cost_oxygen
-    total_cost_with_contingency = total_cost * (1 + contingency_percentage)
 
+    # Weekly consumption is built from the per-session volumes rather than divided back out of the
+    # totals, which keeps it defined for a zero-week program
     return {
-        "weekly_air_consumption_m3": weekly_air_consumption,
-        "weekly_nitrogen_consumption_m3": weekly_nitrogen_consumption,
-        "weekly_oxygen_consumption_m3": weekly_oxygen_consumption,
+        "weekly_air_consumption_m3": air_consumed_per_session * sessions_per_week,
+        "weekly_nitrogen_consumption_m3": nitrogen_consumed_per_session * sessions_per_week,
+        "weekly_oxygen_consumption_m3": oxygen_consumed_per_session * sessions_per_week,
         "total_air_consumption_m3": total_air_consumption,
         "total_nitrogen_consumption_m3": total_nitrogen_consumption,
         "total_oxygen_consumption_m3": total_oxygen_consumption,
@@ -141,67 +255,312 @@ def calculate_gas_consumption(sessions_per_week: int, weeks: int, session_durati
         "total_cost_nitrogen_COP": total_cost_nitrogen,
         "total_cost_oxygen_COP": total_cost_oxygen,
         "total_cost_COP": total_cost,
-        "total_cost_with_contingency_COP": total_cost_with_contingency
+        "total_cost_with_contingency_COP": total_cost * (1 + contingency_percentage)
     }
 
-def main():
+def calculate_gas_consumption(sessions_per_week: int, weeks: int, session_duration_minutes: float, ventilation_rate: float, recovery_duration_minutes: float, price_air: float, price_nitrogen: float, price_oxygen: float, contingency_percentage: float = 0.10) -> dict:
     """
-    Main function to execute the Budget Calculator.
+    Calculate gas consumption and costs for the training program.
+    
+    Parameters:
+    - sessions_per_week: Number of sessions per week.
+    - weeks: Number of weeks.
+    - session_duration_minutes: Duration of each session in minutes.
+    - ventilation_rate: Ventilation rate in L/min.
+    - recovery_duration_minutes: Duration of recovery in minutes.
+    - price_air: Price of compressed air per m3.
+    - price_nitrogen: Price of nitrogen per m3.
+    - price_oxygen: Price of oxygen per m3.
+    - contingency_percentage: Additional cost contingency.
+    
+    Returns:
+    - Dictionary with consumption and cost details.
     """
-    print("=== Normobaric Hypoxia Training Budget Calculator ===\n")
+    per_session = _per_session_consumption(ventilation_rate, session_duration_minutes, recovery_duration_minutes)
+    return _costs_from_consumption(
+        per_session, sessions_per_week, weeks, (price_air, price_nitrogen, price_oxygen), contingency_percentage
+    )
 
-    # Default values
-    DEFAULTS = {
-        "students_per_week": 20,
-        "weeks": 26,
-        "session_duration_minutes": 20,
-        "recovery_duration_minutes": 5,
-        "price_air": 17853,
-        "price_nitrogen": 17838,
-        "price_oxygen": 19654,
-        "contingency_percentage": 0.10,
-        "altitude_ft": 25000
-    }
+def altitude_to_cost(altitude_ft: float, sessions_per_week: int, weeks: int, session_duration_minutes: float, recovery_duration_minutes: float, price_air: float, price_nitrogen: float, price_oxygen: float, contingency_percentage: float = 0.10) -> float:
+    """
+    Calculate the total program cost, including contingency, straight from the simulated altitude.
+
+    Equivalent to calculate_gas_consumption(...)["total_cost_with_contingency_COP"] fed with the ventilation
+    rate from calculate_physiological_parameters, without building either intermediate dictionary.
+    All arguments must be scalars: the function is meant to be called in a loop (it is compiled with
+    Numba when available). For arrays use physiology_array and costs_array instead.
+
+    Parameters:
+    - altitude_ft: Altitude in feet (scalar).
+    - sessions_per_week: Number of sessions per week.
+    - weeks: Number of weeks.
+    - session_duration_minutes: Duration of each session in minutes.
+    - recovery_duration_minutes: Duration of recovery in minutes.
+    - price_air: Price of compressed air per m3.
+    - price_nitrogen: Price of nitrogen per m3.
+    - price_oxygen: Price of oxygen per m3.
+    - contingency_percentage: Additional cost contingency.
 
-    # User inputs
-    students_per_week = get_user_input(f"Enter the number of students per week (default is {DEFAULTS['students_per_week']}): ", DEFAULTS['students_per_week'], int)
-    weeks = get_user_input(f"Enter the number of weeks for the training program (default is {DEFAULTS['weeks']}): ", DEFAULTS['weeks'], int)
-    session_duration_minutes = get_user_input(f"Enter the duration of each session in minutes (default is {DEFAULTS['session_duration_minutes']}): ", DEFAULTS['session_duration_minutes'])
-    recovery_duration_minutes = get_user_input(f"Enter the recovery duration in minutes (default is {DEFAULTS['recovery_duration_minutes']}): ", DEFAULTS['recovery_duration_minutes'])
-    altitude_ft = get_user_input(f"Enter the simulated altitude in feet (default is {DEFAULTS['altitude_ft']} ft): ", DEFAULTS['altitude_ft'])
+    Returns:
+    - Total cost with contingency.
+    """
+    return _compiled_altitude_to_cost()(
+        altitude_ft, sessions_per_week, weeks, session_duration_minutes, recovery_duration_minutes,
+        price_air, price_nitrogen, price_oxygen, contingency_percentage
+    )
 
-    # Calculate physiological parameters
-    physio_params = calculate_physiological_parameters(altitude_ft)
-    ventilation_rate = physio_params['ventilation_rate_L_per_min']
+def _altitude_to_cost_kernel(altitude_ft: float, sessions_per_week: int, weeks: int, session_duration_minutes: float, recovery_duration_minutes: float, price_air: float, price_nitrogen: float, price_oxygen: float, contingency_percentage: float) -> float:
+    """
+    Scalar kernel behind altitude_to_cost, compiled with Numba by _compiled_altitude_to_cost.
+    """
+    ventilation_rate = min(_ventilation_rate(max(0.0, altitude_ft * 0.3048 - VENTILATION_ONSET_M)), MAX_VENTILATION_RATE)
+    cost_per_session = ventilation_rate * 1e-3 * (
+        session_duration_minutes * (price_air + 0.05 * price_nitrogen) + recovery_duration_minutes * price_oxygen
+    )
+    return cost_per_session * sessions_per_week * weeks * (1 + contingency_percentage)
+
+@functools.lru_cache(maxsize=None)
+def _compiled_altitude_to_cost():
+    """
+    Compile _altitude_to_cost_kernel with Numba on first use.
 
-    # Additional user inputs
-    price_air = get_user_input(f"Enter the price of Compressed Air per m3 in COP (default is {DEFAULTS['price_air']}): ", DEFAULTS['price_air'])
-    price_nitrogen = get_user_input(f"Enter the price of Nitrogen per m3 in COP (default is {DEFAULTS['price_nitrogen']}): ", DEFAULTS['price_nitrogen'])
-    price_oxygen = get_user_input(f"Enter the price of Oxygen per m3 in COP (default is {DEFAULTS['price_oxygen']}): ", DEFAULTS['price_oxygen'])
-    contingency_percentage = get_user_input(f"Enter the contingency percentage as a decimal (default is {DEFAULTS['contingency_percentage']}): ", DEFAULTS['contingency_percentage'])
+    Numba takes a noticeable fraction of a second to import, so it is only loaded here and never by a CLI run.
 
-    # Calculate gas consumption and costs
-    results = calculate_gas_consumption(
-        students_per_week, weeks, session_duration_minutes, ventilation_rate,
-        recovery_duration_minutes, price_air, price_nitrogen, price_oxygen, contingency_percentage
+    Returns:
+    - The compiled kernel, or the plain-Python kernel when Numba is not installed.
+    """
+    try:
+        from numba import njit
+        from numba.extending import register_jitable
+    except ImportError:  # Numba is optional; without it the kernel runs as plain Python
+        return _altitude_to_cost_kernel
+    register_jitable(_ventilation_rate)
+    return njit(cache=True, fastmath=True)(_altitude_to_cost_kernel)
+
+def costs_array(sessions_per_week, weeks, prices: tuple, ventilation_rate, session_duration_minutes, recovery_duration_minutes, contingency_percentage=0.10) -> dict:
+    """
+    Calculate gas consumption and costs over arrays of inputs.
+
+    All arguments are broadcast against each other with NumPy, so e.g. a (n, 1) array of weekly sessions
+    and a (1, m) array of weeks give an (n, m) grid of budgets in one call.
+
+    Parameters:
+    - sessions_per_week: Array-like of sessions per week.
+    - weeks: Array-like of weeks.
+    - prices: Tuple (price_air, price_nitrogen, price_oxygen) of array-likes, per m3.
+    - ventilation_rate: Array-like of ventilation rates in L/min, e.g. from physiology_array.
+    - session_duration_minutes: Array-like of session durations in minutes.
+    - recovery_duration_minutes: Array-like of recovery durations in minutes.
+    - contingency_percentage: Array-like of additional cost contingencies.
+
+    Returns:
+    - Dictionary of arrays, each with the broadcast shape of all inputs.
+    """
+    (sessions_per_week, weeks, price_air, price_nitrogen, price_oxygen, ventilation_rate,
+     session_duration_minutes, recovery_duration_minutes, contingency_percentage) = np.broadcast_arrays(
+        sessions_per_week, weeks, *prices, ventilation_rate,
+        session_duration_minutes, recovery_duration_minutes, contingency_percentage
+    )
+    per_session = _per_session_consumption(ventilation_rate, session_duration_minutes, recovery_duration_minutes)
+    return _costs_from_consumption(
+        per_session, sessions_per_week, weeks, (price_air, price_nitrogen, price_oxygen), contingency_percentage
     )
 
-    # Display results
-    print("\n=== Physiological Parameters ===\n")
-    for key, value in physio_params.items():
-        if isinstance(value, float):
-            print(f"{key.replace('_', ' ').title()}: {value:.2f}")
-        else:
-            print(f"{key.replace('_', ' ').title()}: {value}")
+# Keys of the consumption and cost details returned by calculate_gas_consumption
+_COST_KEYS = (
+    "weekly_air_consumption_m3", "weekly_nitrogen_consumption_m3", "weekly_oxygen_consumption_m3",
+    "total_air_consumption_m3", "total_nitrogen_consumption_m3", "total_oxygen_consumption_m3",
+    "total_cost_air_COP", "total_cost_nitrogen_COP", "total_cost_oxygen_COP",
+    "total_cost_COP", "total_cost_with_contingency_COP"
+)
+
+# Display labels and value formats for the report, built once
+_KNOWN_KEYS = ("altitude_ft", *_PHYSIO_KEYS, *_COST_KEYS)
+_PRETTY = {key: key.replace('_', ' ').title() for key in _KNOWN_KEYS}
+_FMT = {"altitude_ft": ":.0f", **{key: ":.2f" for key in (*_PHYSIO_KEYS, *_COST_KEYS)}}  # Altitude in whole feet
+
+def _section_template(keys: tuple) -> str:
+    """
+    Build the report lines for a group of keys as a str.format template.
+
+    Parameters:
+    - keys: Output keys to include, in display order.
+
+    Returns:
+    - Template with one "Label: {key:spec}" line per key.
+    """
+    return "".join(f"{_PRETTY[key]}: {{{key}{_FMT[key]}}}\n" for key in keys)
+
+# Full report for run() output, filled with a single format_map call
+_REPORT_TEMPLATE = (
+    "\n=== Physiological Parameters ===\n\n"
+    + _section_template(("altitude_ft", *_PHYSIO_KEYS))
+    + "\n=== Budget Summary ===\n\n"
+    + _section_template(_COST_KEYS)
+    + "\n=== End of Calculation ==="
+)
+
+# Default input values
+DEFAULTS = {
+    "students_per_week": 20,
+    "weeks": 26,
+    "session_duration_minutes": 20,
+    "recovery_duration_minutes": 5,
+    "price_air": 17853,
+    "price_nitrogen": 17838,
+    "price_oxygen": 19654,
+    "contingency_percentage": 0.10,
+    "altitude_ft": 25000
+}
+
+# Type of each input value; counts are integers, everything else may be fractional
+_INPUT_TYPES = {key: int if key in ("students_per_week", "weeks") else float for key in DEFAULTS}
+
+def _convert_input(key: str, value):
+    """
+    Convert a configuration value to the type expected for its key.
+
+    Parameters:
+    - key: Input name, one of the DEFAULTS keys.
+    - value: Value as given, e.g. read from a JSON file.
+
+    Returns:
+    - The value as an int or a float, according to _INPUT_TYPES.
 
-    print("\n=== Budget Summary ===\n")
-    for key, value in results.items():
-        if isinstance(value, float):
-            print(f"{key.replace('_', ' ').title()}: {value:.2f}")
+    Raises:
+    - ValueError: If the value is not a single number of the expected type.
+    """
+    value_type = _INPUT_TYPES[key]
+    if isinstance(value, (int, float, str)) and not isinstance(value, bool):
+        try:
+            converted = value_type(value)
+            finite = math.isfinite(converted)
+        except (ValueError, OverflowError):
+            pass
         else:
-            print(f"{key.replace('_', ' ').title()}: {value}")
+            # Reject infinities, NaN and fractional counts such as 2.5 weeks
+            if finite and (not isinstance(value, float) or converted == value):
+                return converted
+    raise ValueError(f"Invalid value for {key}: {value!r} (expected a single {value_type.__name__})")
+
+def run(config: dict) -> dict:
+    """
+    Run the Budget Calculator without prompting.
+
+    Every input, including the defaults, is converted with _convert_input, so the returned "altitude_ft"
+    is always a float.
+
+    Parameters:
+    - config: Dictionary of input values keyed like DEFAULTS; missing keys use the defaults.
+
+    Returns:
+    - Dictionary with the physiological parameters followed by the consumption and cost details.
+
+    Raises:
+    - ValueError: If config is not a dictionary, or has unknown keys or values of the wrong type.
+    """
+    if not isinstance(config, dict):
+        raise ValueError(f"Configuration must be a dictionary of input values, not {type(config).__name__}")
+    unknown_keys = set(config) - set(DEFAULTS)
+    if unknown_keys:
+        raise ValueError(f"Unknown configuration keys: {', '.join(sorted(unknown_keys))}")
+    config = {key: _convert_input(key, value) for key, value in {**DEFAULTS, **config}.items()}
+
+    physio_params = calculate_physiological_parameters(config['altitude_ft'])
+    results = calculate_gas_consumption(
+        config['students_per_week'], config['weeks'], config['session_duration_minutes'],
+        physio_params['ventilation_rate_L_per_min'], config['recovery_duration_minutes'],
+        config['price_air'], config['price_nitrogen'], config['price_oxygen'], config['contingency_percentage']
+    )
+    return {**physio_params, **results}
+
+def _prompt_config() -> dict:
+    """
+    Interactively ask the user for every input value.
+
+    Returns:
+    - Dictionary of input values keyed like DEFAULTS.
+    """
+    return {
+        "students_per_week": get_user_input(f"Enter the number of students per week (default is {DEFAULTS['students_per_week']}): ", DEFAULTS['students_per_week'], int),
+        "weeks": get_user_input(f"Enter the number of weeks for the training program (default is {DEFAULTS['weeks']}): ", DEFAULTS['weeks'], int),
+        "session_duration_minutes": get_user_input(f"Enter the duration of each session in minutes (default is {DEFAULTS['session_duration_minutes']}): ", DEFAULTS['session_duration_minutes']),
+        "recovery_duration_minutes": get_user_input(f"Enter the recovery duration in minutes (default is {DEFAULTS['recovery_duration_minutes']}): ", DEFAULTS['recovery_duration_minutes']),
+        "altitude_ft": get_user_input(f"Enter the simulated altitude in feet (default is {DEFAULTS['altitude_ft']} ft): ", DEFAULTS['altitude_ft']),
+        "price_air": get_user_input(f"Enter the price of Compressed Air per m3 in COP (default is {DEFAULTS['price_air']}): ", DEFAULTS['price_air']),
+        "price_nitrogen": get_user_input(f"Enter the price of Nitrogen per m3 in COP (default is {DEFAULTS['price_nitrogen']}): ", DEFAULTS['price_nitrogen']),
+        "price_oxygen": get_user_input(f"Enter the price of Oxygen per m3 in COP (default is {DEFAULTS['price_oxygen']}): ", DEFAULTS['price_oxygen']),
+        "contingency_percentage": get_user_input(f"Enter the contingency percentage as a decimal (default is {DEFAULTS['contingency_percentage']}): ", DEFAULTS['contingency_percentage'])
+    }
+
+def _parse_args(argv=None) -> argparse.Namespace:
+    """
+    Parse the command-line options for non-interactive runs.
+
+    Parameters:
+    - argv: Argument list to parse; defaults to sys.argv[1:].
 
-    print("\n=== End of Calculation ===")
+    Returns:
+    - Parsed arguments; options that were not given are None.
+    """
+    parser = argparse.ArgumentParser(description="Normobaric Hypoxia Training Budget Calculator")
+    parser.add_argument("--config", help="Path to a JSON file of input values, e.g. {\"altitude_ft\": 18000, \"weeks\": 52}.")
+    for key, default in DEFAULTS.items():
+        parser.add_argument(
+            f"--{key.replace('_', '-')}", dest=key, type=_INPUT_TYPES[key],
+            help=f"default: {default}"
+        )
+    return parser.parse_args(argv)
+
+def _load_config(path: str) -> dict:
+    """
+    Read input values from a JSON configuration file.
+
+    Parameters:
+    - path: Path to a JSON file containing an object keyed like DEFAULTS.
+
+    Returns:
+    - Dictionary of input values as stored in the file.
+
+    Raises:
+    - OSError: If the file cannot be read.
+    - ValueError: If the file is not valid JSON or does not contain a JSON object.
+    """
+    with open(path, encoding='utf-8') as config_file:
+        try:
+            config = json.load(config_file)
+        except json.JSONDecodeError as error:
+            raise ValueError(f"{path} is not valid JSON: {error}") from None
+    if not isinstance(config, dict):
+        raise ValueError(f"{path} must contain a JSON object of input values")
+    return config
+
+def main(argv=None):
+    """
+    Main function to execute the Budget Calculator.
+
+    Inputs are read from --config and the individual options when any are given, or when stdin is not
+    a terminal; otherwise the user is prompted for each value.
+    """
+    args = _parse_args(argv)
+    try:
+        config = _load_config(args.config) if args.config else {}
+    except (OSError, ValueError) as error:
+        sys.exit(f"Error: {error}")
+    config.update({key: value for key, value in vars(args).items() if key in DEFAULTS and value is not None})
+
+    print("=== Normobaric Hypoxia Training Budget Calculator ===\n")
+
+    if not args.config and not config and sys.stdin.isatty():
+        config = _prompt_config()
+
+    try:
+        report = run(config)
+    except ValueError as error:
+        sys.exit(f"Error: {error}")
+
+    # Display results
+    print(_REPORT_TEMPLATE.format_map(report))
 
 if __name__ == "__main__":
     try: